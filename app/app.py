@@ -35,7 +35,6 @@ from app.components import (
     render_style_overrides_section,
     render_output_config_section,
     render_generate_section,
-    render_download_section,
     render_advanced_settings,
 )
 
@@ -64,7 +63,7 @@ def main():
     # === Output Configuration Section ===
     output_filename, use_temp_output, overwrite = render_output_config_section(base_config)
     
-    # === Generate Button ===
+    # === Generate Button + Download Section ===
     render_generate_section(
         content_source=content_source,
         template_source=template_source,
@@ -77,9 +76,6 @@ def main():
         uploaded_template=uploaded_template,
     )
     
-    # === Download Section ===
-    render_download_section()
-    
     # === Advanced Settings ===
     render_advanced_settings(base_config)
 
@@ -6,13 +6,17 @@ from typing import Any
 import streamlit as st
 
 from app.constants import (
+    HEADER_SUBTITLE,
+    HEADER_TITLE,
     SRC_DIR,
     SessionKeys,
-    DEFAULT_PAGE_TITLE,
-    DEFAULT_PAGE_LAYOUT,
 )
 from app.config_loader import load_base_config
-from app.state import set_state_value, has_state_key
+from app.state import get_ui_defaults
+
+# This module is imported once per process, so the flag survives reruns and
+# spares a linear scan of sys.path on every script run.
+_src_path_added = False
 
 
 def setup_python_path() -> None:
@@ -20,33 +24,34 @@ def setup_python_path() -> None:
     
     This must be called before importing from iltci_pptx.
     """
+    global _src_path_added
+    if _src_path_added:
+        return
     if str(SRC_DIR) not in sys.path:
         sys.path.insert(0, str(SRC_DIR))
+    _src_path_added = True
 
 
 def init_session_state() -> None:
-    """Initialize session state with base configuration.
+    """Initialize session state with defaults.
     
-    Sets up all required session state variables with defaults.
+    Sets up all required per-session state variables. The base configuration
+    is not stored here; it is served from the process-wide loader cache.
+    Runs once per session; later reruns return after a single key check.
     """
-    if not has_state_key(SessionKeys.BASE_CONFIG):
-        set_state_value(SessionKeys.BASE_CONFIG, load_base_config())
-    
-    if not has_state_key(SessionKeys.PPTX_BYTES):
-        set_state_value(SessionKeys.PPTX_BYTES, None)
-    
-    if not has_state_key(SessionKeys.OUTPUT_FILENAME):
-        set_state_value(SessionKeys.OUTPUT_FILENAME, None)
+    session_state = st.session_state
+    if SessionKeys.SESSION_INITIALIZED in session_state:
+        return
     
-    if not has_state_key(SessionKeys.TEMPLATE_PATH):
-        set_state_value(SessionKeys.TEMPLATE_PATH, None)
+    session_state.setdefault(SessionKeys.PPTX_PATH, None)
+    session_state.setdefault(SessionKeys.OUTPUT_FILENAME, None)
+    session_state.setdefault(SessionKeys.TEMPLATE_PATH, None)
     
     # Track saved files to prevent re-saving on rerun
-    if not has_state_key(SessionKeys.SAVED_FILES):
-        set_state_value(SessionKeys.SAVED_FILES, set())
+    session_state.setdefault(SessionKeys.SAVED_FILES, set())
+    session_state.setdefault(SessionKeys.LAST_ZIP_UPLOAD_ID, None)
     
-    if not has_state_key(SessionKeys.SAVED_ZIP_FILES):
-        set_state_value(SessionKeys.SAVED_ZIP_FILES, set())
+    session_state[SessionKeys.SESSION_INITIALIZED] = True
 
 
 def configure_page(base_config: dict[str, Any]) -> None:
@@ -55,19 +60,18 @@ def configure_page(base_config: dict[str, Any]) -> None:
     Args:
         base_config: Base configuration dictionary
     """
-    ui_config = base_config.get('ui', {})
-    page_config = ui_config.get('page', {})
+    ui_defaults = get_ui_defaults()
     
     st.set_page_config(
-        page_title=page_config.get('title', DEFAULT_PAGE_TITLE),
-        layout=page_config.get('layout', DEFAULT_PAGE_LAYOUT)
+        page_title=ui_defaults.page_title,
+        layout=ui_defaults.page_layout
     )
 
 
 def render_header() -> None:
     """Render the application header."""
-    st.title("🎯 PowerPoint Generator")
-    st.markdown("Generate professional PowerPoint presentations from Markdown content.")
+    st.title(HEADER_TITLE)
+    st.markdown(HEADER_SUBTITLE)
     st.divider()
 
 
@@ -82,7 +86,7 @@ def bootstrap_app() -> dict[str, Any]:
     setup_python_path()
     init_session_state()
     
-    base_config = st.session_state[SessionKeys.BASE_CONFIG]
+    base_config = load_base_config()
     configure_page(base_config)
     render_header()
     
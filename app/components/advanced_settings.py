@@ -4,27 +4,29 @@ from typing import Any
 
 import streamlit as st
 
-from app.constants import LOG_LEVELS, DEFAULT_LOG_LEVEL, SessionKeys
-from app.state import get_settings_config, get_ui_config, get_paths_config
+from app.constants import LOG_LEVELS, LOG_LEVEL_INDEX, SessionKeys
+from app.state import get_ui_defaults
 
 
+@st.fragment
 def render_advanced_settings(base_config: dict[str, Any]) -> None:
     """Render the advanced settings expander.
     
+    Runs as a fragment: changing the log level reruns only this section.
+    The selection is stored under SessionKeys.LOG_LEVEL and read at
+    generation time.
+    
     Args:
         base_config: Base configuration dictionary
     """
     st.divider()
     
     with st.expander("🔧 Advanced Settings", expanded=False):
-        ui_config = get_ui_config()
-        advanced_config = ui_config.get('advanced', {})
-        settings_config = get_settings_config()
+        ui_defaults = get_ui_defaults()
         
         # Logging level (demoted to advanced)
         st.markdown("##### Logging")
-        current_level = settings_config.get('logging', {}).get('level', DEFAULT_LOG_LEVEL)
-        default_index = LOG_LEVELS.index(current_level) if current_level in LOG_LEVELS else 1
+        default_index = LOG_LEVEL_INDEX.get(ui_defaults.log_level, 1)
         
         st.selectbox(
             "Log level",
@@ -35,29 +37,27 @@ def render_advanced_settings(base_config: dict[str, Any]) -> None:
         )
         
         # Template paths (if enabled in config)
-        if advanced_config.get('show_template_paths', False):
+        if ui_defaults.show_template_paths:
             st.markdown("##### Paths")
             st.caption("Template and configuration paths (relative to project root)")
             
-            paths_config = get_paths_config()
-            
             st.text_input(
                 "Template path",
-                value=paths_config.get('template', 'templates/template.pptx'),
+                value=ui_defaults.template_path,
                 disabled=True,
                 help="PowerPoint template file"
             )
             
             st.text_input(
                 "Template config path",
-                value=paths_config.get('template_config', 'assets/template-config.yaml'),
+                value=ui_defaults.template_config_path,
                 disabled=True,
                 help="Template styling configuration"
             )
             
             st.text_input(
                 "Notes path (optional)",
-                value=paths_config.get('notes', ''),
+                value=ui_defaults.notes_path,
                 disabled=True,
                 help="Speaker notes file"
             )
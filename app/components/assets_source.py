@@ -5,15 +5,15 @@ from typing import Any
 
 import streamlit as st
 
-from app.constants import ASSET_FILE_TYPES, SessionKeys
+from app.constants import ASSET_FILE_TYPES, CONFIG_EXTENSIONS, IMAGE_EXTENSIONS, SessionKeys
 from app.state import (
-    get_paths_config,
+    get_ui_defaults,
     get_state_value,
     set_state_value,
     get_saved_files,
     set_saved_files,
-    get_saved_zip_files,
-    set_saved_zip_files,
+    get_last_zip_upload_id,
+    set_last_zip_upload_id,
 )
 from app.services.assets_service import (
     get_or_create_session_assets_dir,
@@ -24,7 +24,15 @@ from app.services.assets_service import (
     get_session_asset_files,
     sync_session_files_with_uploaders,
     clear_upload_widget_state,
+    uploaded_asset_name,
 )
+from app.utils.fs_safety import file_suffix
+
+# Display group for each known asset extension; anything else is 'other'
+_EXTENSION_BUCKETS: dict[str, str] = {
+    **{ext: 'image' for ext in IMAGE_EXTENSIONS},
+    **{ext: 'config' for ext in CONFIG_EXTENSIONS},
+}
 
 
 def _handle_asset_uploads(session_dir: Path) -> bool:
@@ -59,12 +67,24 @@ def _handle_asset_uploads(session_dir: Path) -> bool:
             label_visibility="collapsed"
         )
         
-        # Process uploads immediately
-        if uploaded_assets:
+        # Process uploads immediately, skipping the whole batch when the
+        # uploader holds the same files as on the last processed rerun. The
+        # fingerprint is stored on every rerun (also when the uploader is
+        # emptied), so a removed file that is uploaded again is saved again.
+        upload_fingerprint = frozenset((f.name, f.file_id) for f in uploaded_assets or [])
+        previous_fingerprint = get_state_value(SessionKeys.UPLOAD_FINGERPRINT) or frozenset()
+        if upload_fingerprint != previous_fingerprint:
             saved_files = get_saved_files()
-            new_files = [f for f in uploaded_assets if f.name not in saved_files]
+            # A new file_id under an already saved name is a changed file
+            new_files = [
+                f for f in uploaded_assets or []
+                if uploaded_asset_name(f) not in saved_files
+                or (f.name, f.file_id) not in previous_fingerprint
+            ]
             
-            if new_files:
+            if not new_files:
+                set_state_value(SessionKeys.UPLOAD_FINGERPRINT, upload_fingerprint)
+            else:
                 try:
                     # Check if any files have folder paths (indicating folder upload)
                     has_folder_structure = any('/' in f.name or '\\' in f.name for f in new_files)
@@ -85,6 +105,7 @@ def _handle_asset_uploads(session_dir: Path) -> bool:
                         if saved:
                             st.success(f"✓ Saved {len(saved)} file(s): {', '.join(saved)}")
                             files_saved = True
+                    set_state_value(SessionKeys.UPLOAD_FINGERPRINT, upload_fingerprint)
                 except ValueError as e:
                     st.error(f"❌ Error saving files: {e}")
     
@@ -100,15 +121,15 @@ def _handle_asset_uploads(session_dir: Path) -> bool:
             label_visibility="collapsed"
         )
         
-        # Process zip uploads immediately
+        # Process zip uploads immediately. Each upload has a unique file_id,
+        # so a different archive with a previously seen name is still processed
         if uploaded_zip:
-            saved_zip_files = get_saved_zip_files()
-            
-            if uploaded_zip.name not in saved_zip_files:
+            if uploaded_zip.file_id != get_last_zip_upload_id():
                 try:
+                    # Members whose size and CRC match the file on disk are
+                    # skipped by extract_zip, so re-uploads are cheap
                     extracted = extract_zip(uploaded_zip, session_dir)
-                    saved_zip_files.add(uploaded_zip.name)
-                    set_saved_zip_files(saved_zip_files)
+                    set_last_zip_upload_id(uploaded_zip.file_id)
                     if extracted:
                         st.success(f"✓ Extracted {len(extracted)} file(s) from {uploaded_zip.name}")
                         files_saved = True
@@ -131,25 +152,24 @@ def _display_session_assets(session_dir: Path) -> None:
     
     if files:
         with st.expander(f"📁 Session Assets ({len(files)} files)", expanded=True):
-            # Group files by type
-            images = [f for f in files if Path(f).suffix.lower() in {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.tiff'}]
-            configs = [f for f in files if Path(f).suffix.lower() in {'.yaml', '.yml', '.json'}]
-            others = [f for f in files if f not in images and f not in configs]
+            # Group files by type in a single pass, one lookup per file
+            buckets = {'image': [], 'config': [], 'other': []}
+            for f in files:
+                buckets[_EXTENSION_BUCKETS.get(file_suffix(f), 'other')].append(f)
+            images, configs, others = buckets['image'], buckets['config'], buckets['other']
             
+            # One text element per group rather than one per file
             if images:
                 st.markdown("**Images:**")
-                for img in images:
-                    st.text(f"  📷 {img}")
+                st.text("\n".join(f"  📷 {img}" for img in images))
             
             if configs:
                 st.markdown("**Config files:**")
-                for cfg in configs:
-                    st.text(f"  ⚙️ {cfg}")
+                st.text("\n".join(f"  ⚙️ {cfg}" for cfg in configs))
             
             if others:
                 st.markdown("**Other files:**")
-                for other in others:
-                    st.text(f"  📄 {other}")
+                st.text("\n".join(f"  📄 {other}" for other in others))
     else:
         st.info("No custom assets uploaded yet. Upload files above to use custom assets.")
 
@@ -196,7 +216,10 @@ def render_assets_source_section(base_config: dict[str, Any]) -> str:
             clear_session_assets(session_assets_dir)
             # Clear the tracking sets so files can be re-uploaded
             set_saved_files(set())
-            set_saved_zip_files(set())
+            set_last_zip_upload_id(None)
+            set_state_value(SessionKeys.ASSET_HASH_INDEX, {})
+            set_state_value(SessionKeys.UPLOAD_FINGERPRINT, None)
+            set_state_value(SessionKeys.UPLOADER_SIGNATURE, None)
             # Clear widget states to reset uploaders
             clear_upload_widget_state()
             st.success("✅ Assets cleared successfully!")
@@ -204,7 +227,7 @@ def render_assets_source_section(base_config: dict[str, Any]) -> str:
     elif assets_source == "Default":
         set_state_value(SessionKeys.CUSTOM_ASSETS_DIR, None)
         with col_a2:
-            default_assets = get_paths_config().get('assets_dir', 'assets/')
+            default_assets = get_ui_defaults().assets_dir
             st.info(f"Using default: `{default_assets}`")
     else:
         # "None" - no assets
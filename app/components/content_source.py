@@ -5,7 +5,7 @@ from typing import Any
 import streamlit as st
 
 from app.constants import SessionKeys
-from app.state import get_paths_config
+from app.state import get_ui_defaults
 
 
 def render_content_source_section(base_config: dict[str, Any]) -> tuple[str, Any]:
@@ -41,7 +41,7 @@ def render_content_source_section(base_config: dict[str, Any]) -> tuple[str, Any
                 st.success(f"✓ Uploaded: {uploaded_file.name}")
     else:
         with col2:
-            default_content = get_paths_config().get('content', 'content/slides.md')
+            default_content = get_ui_defaults().content_path
             st.info(f"Using default: `{default_content}`")
     
     st.divider()
@@ -1,23 +1,32 @@
 """Download section component."""
 
+from pathlib import Path
+
 import streamlit as st
 
-from app.state import get_pptx_bytes, get_output_filename
+from app.state import get_pptx_path, get_output_filename
 
 
+@st.fragment
 def render_download_section() -> None:
-    """Render the download section if a file is available."""
-    pptx_bytes = get_pptx_bytes()
+    """Render the download section if a file is available.
+    
+    Runs as a fragment so clicking the download button only reruns this
+    section instead of the whole page. The file is read from disk here
+    rather than being held in session state.
+    """
+    pptx_path = get_pptx_path()
     output_filename = get_output_filename()
     
-    if pptx_bytes is not None:
+    if pptx_path is not None and Path(pptx_path).is_file():
         st.divider()
         st.subheader("📥 Download")
-        st.download_button(
-            label=f"📥 Download {output_filename}",
-            data=pptx_bytes,
-            file_name=output_filename,
-            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            use_container_width=True,
-            key="download_button"
-        )
+        with open(pptx_path, 'rb') as pptx_file:
+            st.download_button(
+                label=f"📥 Download {output_filename}",
+                data=pptx_file,
+                file_name=output_filename,
+                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                use_container_width=True,
+                key="download_button"
+            )
@@ -1,17 +1,20 @@
 """Generate button and generation logic component."""
 
+import logging
 from pathlib import Path
 from typing import Any
 
 import streamlit as st
 
+from app.components.download_section import render_download_section
+from app.state import get_log_level
 from app.services.generation_service import (
     generate_presentation,
-    write_temp_file,
-    cleanup_temp_file,
+    materialize_upload,
 )
 
 
+@st.fragment
 def render_generate_section(
     content_source: str,
     template_source: str,
@@ -23,7 +26,11 @@ def render_generate_section(
     uploaded_file: Any,
     uploaded_template: Any,
 ) -> bool:
-    """Render the generate button and handle generation.
+    """Render the generate button, handle generation and show the download.
+    
+    Runs as a fragment, so clicking Generate reruns only this section. The
+    download section is rendered inside it so a fresh result appears
+    without a full-page rerun.
     
     Args:
         content_source: Selected content source
@@ -45,9 +52,52 @@ def render_generate_section(
         use_container_width=True
     )
     
-    if not generate_clicked:
-        return False
+    success = False
+    if generate_clicked:
+        success = _run_generation(
+            content_source=content_source,
+            template_source=template_source,
+            assets_source=assets_source,
+            style_mode=style_mode,
+            output_filename=output_filename,
+            use_temp_output=use_temp_output,
+            overwrite=overwrite,
+            uploaded_file=uploaded_file,
+            uploaded_template=uploaded_template,
+        )
+    
+    render_download_section()
+    
+    return success
+
+
+def _run_generation(
+    content_source: str,
+    template_source: str,
+    assets_source: str,
+    style_mode: str,
+    output_filename: str,
+    use_temp_output: bool,
+    overwrite: bool,
+    uploaded_file: Any,
+    uploaded_template: Any,
+) -> bool:
+    """Validate inputs and generate the presentation.
     
+    Args:
+        content_source: Selected content source
+        template_source: Selected template source
+        assets_source: Selected assets source
+        style_mode: Selected style mode
+        output_filename: Output filename
+        use_temp_output: Whether to use temp output directory
+        overwrite: Whether to allow overwriting
+        uploaded_file: Uploaded content file (if any)
+        uploaded_template: Uploaded template file (if any)
+        
+    Returns:
+        True if generation was successful, False otherwise
+    """
     # Validate inputs
     if content_source == "Upload custom content" and uploaded_file is None:
         st.error("❌ Please upload a Markdown file first.")
@@ -60,40 +110,42 @@ def render_generate_section(
     temp_content_path: str | None = None
     temp_template_path: str | None = None
     
-    try:
-        # Handle uploaded content file
-        if content_source == "Upload custom content" and uploaded_file:
-            temp_content_path = write_temp_file(uploaded_file.read(), '.md')
-        
-        # Handle uploaded template file
-        if template_source == "Upload custom template" and uploaded_template:
-            suffix = Path(uploaded_template.name).suffix or '.pptx'
-            temp_template_path = write_temp_file(uploaded_template.read(), suffix)
-        
-        # Generate presentation
-        with st.spinner('🔄 Generating presentation...'):
-            result = generate_presentation(
-                content_source=content_source,
-                template_source=template_source,
-                assets_source=assets_source,
-                style_mode=style_mode,
-                output_filename=output_filename,
-                use_temp_output=use_temp_output,
-                overwrite=overwrite,
-                uploaded_content_path=temp_content_path,
-                uploaded_template_path=temp_template_path,
-            )
-        
-        if result.success:
-            st.success("✅ PowerPoint generated successfully!")
-            return True
-        else:
-            st.error(f"❌ {result.error_message}")
-            if result.exception:
-                st.exception(result.exception)
+    # Uploads are written to disk once per upload and reused across
+    # generations; they live in the session output directory
+    if content_source == "Upload custom content" and uploaded_file:
+        temp_content_path = materialize_upload(uploaded_file, '.md', 'content')
+    
+    if template_source == "Upload custom template" and uploaded_template:
+        suffix = Path(uploaded_template.name).suffix or '.pptx'
+        try:
+            temp_template_path = materialize_upload(uploaded_template, suffix, 'template')
+        except ValueError as e:
+            st.error(f"❌ {e}")
             return False
-            
-    finally:
-        # Cleanup temp files
-        cleanup_temp_file(temp_content_path)
-        cleanup_temp_file(temp_template_path)
+    
+    # Generate presentation
+    with st.spinner('🔄 Generating presentation...'):
+        result = generate_presentation(
+            content_source=content_source,
+            template_source=template_source,
+            assets_source=assets_source,
+            style_mode=style_mode,
+            output_filename=output_filename,
+            use_temp_output=use_temp_output,
+            overwrite=overwrite,
+            uploaded_content_path=temp_content_path,
+            uploaded_template_path=temp_template_path,
+        )
+    
+    if result.success:
+        st.success("✅ PowerPoint generated successfully!")
+        return True
+    else:
+        st.error(f"❌ {result.error_message}")
+        if result.exception:
+            # Full traceback goes to the server log; only ship it to the
+            # browser when debugging.
+            logging.error(result.error_message, exc_info=result.exception)
+            if get_log_level() == 'DEBUG':
+                st.exception(result.exception)
+        return False
@@ -4,8 +4,7 @@ from typing import Any
 
 import streamlit as st
 
-from app.constants import DEFAULT_OUTPUT_FILENAME
-from app.state import get_ui_config, get_settings_config
+from app.state import get_ui_defaults
 
 
 def render_output_config_section(base_config: dict[str, Any]) -> tuple[str, bool, bool]:
@@ -19,16 +18,14 @@ def render_output_config_section(base_config: dict[str, Any]) -> tuple[str, bool
     """
     st.subheader("📤 Output Configuration")
     
-    ui_config = get_ui_config()
-    defaults = ui_config.get('defaults', {})
-    settings_config = get_settings_config()
+    ui_defaults = get_ui_defaults()
     
     col3, col4 = st.columns(2)
     
     with col3:
         output_filename = st.text_input(
             "Output filename",
-            value=defaults.get('output_filename', DEFAULT_OUTPUT_FILENAME),
+            value=ui_defaults.output_filename,
             help="Name for the generated PPTX file"
         )
         
@@ -39,13 +36,13 @@ def render_output_config_section(base_config: dict[str, Any]) -> tuple[str, bool
     with col4:
         use_temp_output = st.checkbox(
             "Use temporary directory (recommended)",
-            value=defaults.get('use_temp_output', True),
+            value=ui_defaults.use_temp_output,
             help="Generate file in temp directory for clean download"
         )
         
         overwrite = st.checkbox(
             "Overwrite existing output",
-            value=settings_config.get('overwrite_output', True),
+            value=ui_defaults.overwrite_output,
             help="Allow overwriting if output file already exists"
         )
     
@@ -2,12 +2,11 @@
 
 from typing import Any
 
-import yaml
 import streamlit as st
 
-from app.constants import SessionKeys
-from app.state import get_ui_config, set_style_overrides
-from app.config_loader import load_style_overrides
+from app.constants import STYLE_MODE_INDEX, STYLE_MODE_OPTIONS, SessionKeys
+from app.state import get_ui_defaults, set_style_overrides
+from app.config_loader import load_style_overrides, load_uploaded_style_overrides
 
 
 def render_style_overrides_section(base_config: dict[str, Any]) -> str:
@@ -21,19 +20,15 @@ def render_style_overrides_section(base_config: dict[str, Any]) -> str:
     """
     st.subheader("🎨 Style Overrides")
     
-    ui_config = get_ui_config()
-    
     # Get default mode from config
-    style_mode_options = ["None", "Default", "Upload custom overrides"]
-    default_style_mode = ui_config.get("style_overrides_mode", "Default")
-    style_mode_index = style_mode_options.index(default_style_mode) if default_style_mode in style_mode_options else 0
+    style_mode_index = STYLE_MODE_INDEX.get(get_ui_defaults().style_overrides_mode, 0)
     
     col_s1, col_s2 = st.columns(2)
     
     with col_s1:
         style_mode = st.radio(
             "Style overrides:",
-            style_mode_options,
+            STYLE_MODE_OPTIONS,
             key=SessionKeys.STYLE_MODE,
             index=style_mode_index,
             horizontal=True
@@ -54,7 +49,7 @@ def render_style_overrides_section(base_config: dict[str, Any]) -> str:
                 key="styles_uploader"
             )
             if uploaded_styles:
-                style_overrides = yaml.safe_load(uploaded_styles)
+                style_overrides = load_uploaded_style_overrides(uploaded_styles)
                 st.success(f"✓ Loaded: {uploaded_styles.name}")
     else:
         with col_s2:
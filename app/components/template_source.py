@@ -5,7 +5,7 @@ from typing import Any
 import streamlit as st
 
 from app.constants import SessionKeys, TEMPLATE_FILE_TYPES
-from app.state import get_paths_config
+from app.state import get_ui_defaults
 
 
 def render_template_source_section(base_config: dict[str, Any]) -> tuple[str, Any]:
@@ -42,7 +42,7 @@ def render_template_source_section(base_config: dict[str, Any]) -> tuple[str, An
                 st.success(f"✓ Uploaded: {uploaded_template.name}")
     elif template_source == "Default":
         with col_t2:
-            default_template = get_paths_config().get('template', 'templates/template.pptx')
+            default_template = get_ui_defaults().template_path
             st.info(f"Using default: `{default_template}`")
     else:
         # "None" - use blank presentation with built-in layouts only
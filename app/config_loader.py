@@ -1,16 +1,28 @@
 """Configuration loading utilities."""
 
+import os
 from pathlib import Path
 from typing import Any
 
+import streamlit as st
 import yaml
 
 from app.constants import CONFIG_DIR
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
+
+@st.cache_resource(show_spinner=False)
 def load_base_config(config_path: Path | None = None) -> dict[str, Any]:
     """Load the base configuration from config.yaml.
     
+    The parsed result is cached process-wide and the same dictionary is
+    shared by every session, so only the first session pays for reading and
+    parsing the file. Callers must treat it as read-only.
+    
     Args:
         config_path: Optional path to config file. Defaults to CONFIG_DIR / "config.yaml"
         
@@ -24,12 +36,30 @@ def load_base_config(config_path: Path | None = None) -> dict[str, Any]:
         config_path = CONFIG_DIR / "config.yaml"
     
     with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+@st.cache_data(show_spinner=False)
+def _parse_style_overrides(style_path: str, mtime_ns: int) -> dict[str, Any] | None:
+    """Parse a style overrides file, cached on its path and modification time.
+    
+    Args:
+        style_path: Path to the style overrides YAML file
+        mtime_ns: File modification time, so edits invalidate the cache entry
+        
+    Returns:
+        Parsed style overrides dictionary
+    """
+    with open(style_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def load_style_overrides(style_path: Path | None = None) -> dict[str, Any] | None:
     """Load style overrides from YAML file.
     
+    Parsing is cached across reruns and sessions; editing the file on disk
+    invalidates the cached result.
+    
     Args:
         style_path: Optional path to style overrides. Defaults to CONFIG_DIR / "style-overrides.yaml"
         
@@ -40,7 +70,20 @@ def load_style_overrides(style_path: Path | None = None) -> dict[str, Any] | Non
         style_path = CONFIG_DIR / "style-overrides.yaml"
     
     try:
-        with open(style_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        mtime_ns = os.stat(style_path).st_mtime_ns
+        return _parse_style_overrides(str(style_path), mtime_ns)
     except FileNotFoundError:
         return None
+
+
+def load_uploaded_style_overrides(uploaded_file: Any) -> dict[str, Any] | None:
+    """Parse style overrides from an uploaded YAML file.
+    
+    Args:
+        uploaded_file: File-like object (e.g. Streamlit UploadedFile) with YAML content
+        
+    Returns:
+        Parsed style overrides dictionary, or None if the file is empty
+    """
+    uploaded_file.seek(0)
+    return yaml.load(uploaded_file, Loader=_YamlLoader)
@@ -9,20 +9,22 @@ CONFIG_DIR = PROJECT_ROOT / "configs"
 SRC_DIR = PROJECT_ROOT / "src"
 
 # === Allowed File Extensions ===
-ALLOWED_ASSET_EXTENSIONS: frozenset[str] = frozenset({
-    # Images
+IMAGE_EXTENSIONS: frozenset[str] = frozenset({
     '.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.tiff',
-    # Data/config
+})
+
+CONFIG_EXTENSIONS: frozenset[str] = frozenset({
     '.yaml', '.yml', '.json',
+})
+
+ALLOWED_ASSET_EXTENSIONS: frozenset[str] = IMAGE_EXTENSIONS | CONFIG_EXTENSIONS | frozenset({
     # Text/style
     '.css', '.txt', '.md',
 })
 
-# File types for Streamlit uploaders (without dots)
-ASSET_FILE_TYPES: list[str] = [
-    'png', 'jpg', 'jpeg', 'gif', 'webp', 'bmp', 'tiff',
-    'yaml', 'yml', 'json', 'css', 'txt', 'md'
-]
+# File types for Streamlit uploaders (without dots), derived once from the
+# allowed extensions so the two lists cannot drift apart
+ASSET_FILE_TYPES: list[str] = sorted(ext.lstrip('.') for ext in ALLOWED_ASSET_EXTENSIONS)
 
 TEMPLATE_FILE_TYPES: list[str] = ['pptx', 'potx']
 
@@ -30,14 +32,19 @@ TEMPLATE_FILE_TYPES: list[str] = ['pptx', 'potx']
 class SessionKeys:
     """Session state key constants to avoid magic strings."""
     SESSION_ID = 'session_id'
+    SESSION_INITIALIZED = 'session_initialized'
     SESSION_ASSETS_DIR = 'session_assets_dir'
+    SESSION_OUTPUT_DIR = 'session_output_dir'
+    MATERIALIZED_UPLOADS = 'materialized_uploads'
     CUSTOM_ASSETS_DIR = 'custom_assets_dir'
-    BASE_CONFIG = 'base_config'
-    PPTX_BYTES = 'pptx_bytes'
+    PPTX_PATH = 'pptx_path'
     OUTPUT_FILENAME = 'output_filename'
     TEMPLATE_PATH = 'template_path'
     SAVED_FILES = 'saved_files'
-    SAVED_ZIP_FILES = 'saved_zip_files'
+    LAST_ZIP_UPLOAD_ID = 'last_zip_upload_id'
+    ASSET_HASH_INDEX = 'asset_hash_index'
+    UPLOAD_FINGERPRINT = 'upload_fingerprint'
+    UPLOADER_SIGNATURE = 'uploader_signature'
     STYLE_OVERRIDES = 'style_overrides'
     LOG_LEVEL = 'log_level'
     CONTENT_SOURCE = 'content_source'
@@ -51,4 +58,11 @@ DEFAULT_PAGE_TITLE = 'PowerPoint Generator'
 DEFAULT_PAGE_LAYOUT = 'wide'
 DEFAULT_OUTPUT_FILENAME = 'presentation.pptx'
 DEFAULT_LOG_LEVEL = 'INFO'
-LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
+LOG_LEVELS: tuple[str, ...] = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+LOG_LEVEL_INDEX: dict[str, int] = {level: i for i, level in enumerate(LOG_LEVELS)}
+STYLE_MODE_OPTIONS: tuple[str, ...] = ('None', 'Default', 'Upload custom overrides')
+STYLE_MODE_INDEX: dict[str, int] = {mode: i for i, mode in enumerate(STYLE_MODE_OPTIONS)}
+
+# === Header Text ===
+HEADER_TITLE = '🎯 PowerPoint Generator'
+HEADER_SUBTITLE = 'Generate professional PowerPoint presentations from Markdown content.'
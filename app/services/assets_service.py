@@ -1,18 +1,33 @@
 """Asset management service - handles file uploads and session assets."""
 
 import logging
+import os
 import shutil
 import tempfile
 import uuid
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import streamlit as st
 
 from app.constants import ALLOWED_ASSET_EXTENSIONS, SessionKeys
-from app.utils.fs_safety import is_safe_filename, strip_assets_prefix
+from app.utils.fs_safety import file_suffix, is_safe_filename, strip_assets_prefix
+from app.utils.hashing import sha256_digest
 from app.state import get_state_value, set_state_value, has_state_key
 
+# Decompression, hashing and file writes release the GIL, so extraction and
+# multi-file saves scale with threads up to the core count
+_IO_WORKERS = min(8, os.cpu_count() or 1)
+
+# Output buffer for extracted members, so small decompressed reads are
+# coalesced into 64 KiB writes
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Zip members below this size are read whole instead of streamed
+_SMALL_MEMBER_SIZE = 64 * 1024
+
 
 def get_or_create_session_assets_dir() -> Path:
     """Get or create a session-scoped temporary assets directory.
@@ -40,6 +55,93 @@ def get_or_create_session_assets_dir() -> Path:
     return session_dir
 
 
+def _write_uploads(writes: dict[Path, object]) -> None:
+    """Write a batch of uploaded files, in parallel when there are several.
+    
+    Session state is only touched here, on the script thread; workers share
+    the content hash index as a plain dict.
+    
+    Args:
+        writes: Mapping of destination path -> Streamlit UploadedFile
+    """
+    hash_index = get_state_value(SessionKeys.ASSET_HASH_INDEX, {})
+    
+    max_workers = min(_IO_WORKERS, len(writes))
+    if max_workers <= 1:
+        for dest_path, uploaded_file in writes.items():
+            _write_upload(uploaded_file, dest_path, hash_index)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(_write_upload, uploaded_file, dest_path, hash_index)
+                           for dest_path, uploaded_file in writes.items()]:
+                future.result()
+    
+    set_state_value(SessionKeys.ASSET_HASH_INDEX, hash_index)
+
+
+def _write_upload(uploaded_file, dest_path: Path, hash_index: dict) -> None:
+    """Stream an uploaded file to disk without buffering it in full.
+    
+    The file is written to a sibling '.part' file and atomically moved into
+    place, so readers never see a partially written asset. Content already
+    saved this session under another name is hard-linked instead of written
+    again.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile object
+        dest_path: Destination file path (overwritten if it exists)
+        hash_index: Content digest index, updated with the written file
+    """
+    digest = sha256_digest(uploaded_file)
+    
+    existing_path = _indexed_asset_path(hash_index, digest)
+    
+    part_path = dest_path.with_name(dest_path.name + '.part')
+    try:
+        linked = False
+        if existing_path is not None and existing_path != str(dest_path):
+            try:
+                os.link(existing_path, part_path)
+                linked = True
+            except OSError:
+                pass
+        if not linked:
+            with open(part_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as out:
+                shutil.copyfileobj(uploaded_file, out, 1024 * 1024)
+        os.replace(part_path, dest_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    
+    stat = os.stat(dest_path)
+    hash_index[digest] = (str(dest_path), stat.st_size, stat.st_mtime_ns)
+
+
+def _indexed_asset_path(hash_index: dict, digest: str) -> str | None:
+    """Look up a saved asset by content digest, ignoring stale entries.
+    
+    Args:
+        hash_index: Mapping of digest -> (path, size, mtime_ns)
+        digest: SHA-256 hex digest of the content
+        
+    Returns:
+        Path of an on-disk file with that content, or None
+    """
+    entry = hash_index.get(digest)
+    if entry is None:
+        return None
+    
+    path, size, mtime_ns = entry
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    # A changed size or mtime means the file was replaced since it was indexed
+    if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+        return None
+    return path
+
+
 def save_uploaded_files(files, dest_dir: Path) -> list[str]:
     """Save uploaded files to destination directory, overwriting existing files.
     
@@ -54,6 +156,8 @@ def save_uploaded_files(files, dest_dir: Path) -> list[str]:
         ValueError: If file has unsafe filename
     """
     saved_files = []
+    writes = {}
+    log_each = logging.getLogger().isEnabledFor(logging.DEBUG)
     for uploaded_file in files:
         filename = uploaded_file.name
         
@@ -62,18 +166,22 @@ def save_uploaded_files(files, dest_dir: Path) -> list[str]:
             raise ValueError(f"Unsafe filename: {filename}")
         
         # Check file extension
-        ext = Path(filename).suffix.lower()
+        ext = file_suffix(filename)
         if ext not in ALLOWED_ASSET_EXTENSIONS:
             st.warning(f"Skipping {filename}: unsupported file type")
             continue
         
-        dest_path = dest_dir / filename
-        
-        # Write file (overwrites if exists)
-        dest_path.write_bytes(uploaded_file.read())
-        logging.info(f"Saved uploaded file: {dest_path}")
+        # Queue file for writing (overwrites if exists; last upload of a
+        # name wins)
+        writes[dest_dir / filename] = uploaded_file
         saved_files.append(filename)
     
+    _write_uploads(writes)
+    if log_each:
+        for dest_path in writes:
+            logging.debug(f"Saved uploaded file: {dest_path}")
+    
+    logging.info(f"Saved {len(saved_files)} uploaded file(s) to {dest_dir}")
     return saved_files
 
 
@@ -96,6 +204,8 @@ def save_uploaded_directory(files, dest_dir: Path) -> tuple[list[str], list[str]
     """
     skipped_files = []
     saved_files = []
+    writes = {}
+    log_each = logging.getLogger().isEnabledFor(logging.DEBUG)
     
     for uploaded_file in files:
         # Get the relative path (may include subdirectories like "assets/file.png")
@@ -109,28 +219,99 @@ def save_uploaded_directory(files, dest_dir: Path) -> tuple[list[str], list[str]
         rel_path = strip_assets_prefix(original_path)
         
         # Check file extension
-        ext = Path(rel_path).suffix.lower()
+        ext = file_suffix(rel_path)
         if ext not in ALLOWED_ASSET_EXTENSIONS:
             skipped_files.append(original_path)
             continue
         
-        # Build destination path (flat, no 'assets/' subdirectory)
-        dest_path = dest_dir / rel_path
-        
-        # Create parent directories if needed (for any remaining subdirectories)
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write file (overwrites if exists)
-        dest_path.write_bytes(uploaded_file.read())
-        logging.info(f"Saved directory file: {dest_path} (from {original_path})")
+        # Queue file for writing at its flat destination (no 'assets/'
+        # subdirectory; last upload of a path wins)
+        writes[dest_dir / rel_path] = uploaded_file
         saved_files.append(rel_path)
     
+    # Create parent directories once (for any remaining subdirectories)
+    for parent in {dest_path.parent for dest_path in writes}:
+        parent.mkdir(parents=True, exist_ok=True)
+    
+    _write_uploads(writes)
+    if log_each:
+        for dest_path, uploaded_file in writes.items():
+            logging.debug(f"Saved directory file: {dest_path} (from {uploaded_file.name})")
+    
+    logging.info(f"Saved {len(saved_files)} directory file(s) to {dest_dir}, skipped {len(skipped_files)}")
     return saved_files, skipped_files
 
 
+def _member_unchanged(zinfo: zipfile.ZipInfo, member_path: str) -> bool:
+    """Check whether a zip member already exists on disk with identical content.
+    
+    Compares the size first, then the CRC32 recorded in the central directory,
+    so unchanged members can be skipped without decompressing them.
+    
+    Args:
+        zinfo: Zip member info
+        member_path: Destination path of the member
+        
+    Returns:
+        True if the file on disk matches the member, False otherwise
+    """
+    try:
+        if os.stat(member_path).st_size != zinfo.file_size:
+            return False
+    except OSError:
+        return False
+    
+    crc = 0
+    with open(member_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc == zinfo.CRC
+
+
+def _extract_zip_members(zip_path: Path, members: list) -> None:
+    """Extract a batch of zip members using a dedicated ZipFile handle.
+    
+    Args:
+        zip_path: Path to the zip archive on disk
+        members: List of (zinfo, stripped_member, member_path) tuples, with
+            member_path as a normalized absolute path string
+    """
+    log_each = logging.getLogger().isEnabledFor(logging.DEBUG)
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for zinfo, stripped_member, member_path in members:
+            if _member_unchanged(zinfo, member_path):
+                if log_each:
+                    logging.debug(f"Zip member unchanged on disk, skipping: {zinfo.filename}")
+                continue
+            
+            # Never write through a hard link shared with another asset
+            try:
+                os.unlink(member_path)
+            except FileNotFoundError:
+                pass
+            
+            # Extract to stripped path; small members are read in one call,
+            # larger ones streamed so they are never held in memory in full
+            if zinfo.file_size < _SMALL_MEMBER_SIZE:
+                data = zip_ref.read(zinfo)
+                with open(member_path, 'wb') as dst:
+                    dst.write(data)
+            else:
+                with zip_ref.open(zinfo) as src, open(member_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as dst:
+                    shutil.copyfileobj(src, dst, min(zinfo.file_size, 1024 * 1024))
+            
+            if log_each:
+                logging.debug(f"Extracted zip member: {zinfo.filename} -> {stripped_member}")
+
+
 def extract_zip(uploaded_zip, dest_dir: Path) -> list[str]:
     """Extract uploaded zip file to destination directory, stripping 'assets/' prefix.
     
+    Members with unsupported extensions are skipped. The rest are validated
+    up front, then extracted in parallel; each worker
+    reads the archive through its own ZipFile handle since ZipFile is not
+    safe to share between threads.
+    
     Args:
         uploaded_zip: Streamlit UploadedFile object for the zip
         dest_dir: Destination directory
@@ -141,43 +322,86 @@ def extract_zip(uploaded_zip, dest_dir: Path) -> list[str]:
     Raises:
         ValueError: If zip contains unsafe paths
     """
-    extracted_files = []
-    with zipfile.ZipFile(uploaded_zip, 'r') as zip_ref:
-        for member in zip_ref.namelist():
-            # Skip directories (they will be created when files are extracted)
-            if member.endswith('/'):
-                continue
-            
-            # Strip 'assets/' prefix to save flat (matching resolve_asset_ref behavior)
-            stripped_member = strip_assets_prefix(member)
-            
-            # Check for zip slip (path traversal) on the stripped path
-            member_path = (dest_dir / stripped_member).resolve()
-            if not str(member_path).startswith(str(dest_dir.resolve())):
-                raise ValueError(f"Unsafe zip path: {member}")
-            
-            # Ensure parent directory exists
-            member_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Extract to stripped path (read from zip and write to new location)
-            with zip_ref.open(member) as src, open(member_path, 'wb') as dst:
-                dst.write(src.read())
-            
-            logging.info(f"Extracted zip member: {member} -> {stripped_member}")
-            extracted_files.append(stripped_member)
+    # Persist the upload so every worker can open its own handle on it
+    uploaded_zip.seek(0)
+    with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_zip:
+        shutil.copyfileobj(uploaded_zip, tmp_zip, 1024 * 1024)
+        zip_path = Path(tmp_zip.name)
+    
+    try:
+        # Keyed by target path: 'assets/a.png' and 'a.png' both land on
+        # 'a.png', and the later member wins as in a serial extraction, so no
+        # two workers ever write the same file
+        targets = {}
+        skipped_members = []
+        dest_root = str(dest_dir.resolve()) + os.sep
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            for zinfo in zip_ref.infolist():
+                member = zinfo.filename
+                
+                # Skip directories (they will be created when files are extracted)
+                if zinfo.is_dir():
+                    continue
+                
+                # Strip 'assets/' prefix to save flat (matching resolve_asset_ref behavior)
+                stripped_member = strip_assets_prefix(member)
+                
+                # Check for zip slip (path traversal) on the stripped path
+                # (lexical check against the root resolved once, no stat per member)
+                candidate = os.path.normpath(os.path.join(dest_root, stripped_member))
+                if os.path.isabs(stripped_member) or not candidate.startswith(dest_root):
+                    raise ValueError(f"Unsafe zip path: {member}")
+                
+                # Check file extension (same allow-list as direct uploads)
+                if file_suffix(stripped_member) not in ALLOWED_ASSET_EXTENSIONS:
+                    skipped_members.append(member)
+                    continue
+                
+                targets[candidate] = (zinfo, stripped_member, candidate)
+        members = list(targets.values())
+        
+        # Ensure parent directories exist before any worker starts writing
+        for parent in {os.path.dirname(member_path) for _, _, member_path in members}:
+            os.makedirs(parent, exist_ok=True)
+        
+        # Split members round-robin across workers, one ZipFile handle each
+        max_workers = min(_IO_WORKERS, len(members))
+        if max_workers <= 1:
+            _extract_zip_members(zip_path, members)
+        else:
+            batches = [members[i::max_workers] for i in range(max_workers)]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for future in [executor.submit(_extract_zip_members, zip_path, batch)
+                               for batch in batches]:
+                    future.result()
+    finally:
+        zip_path.unlink(missing_ok=True)
     
-    return extracted_files
+    logging.info(f"Extracted {len(members)} zip member(s) to {dest_dir}, skipped {len(skipped_members)}")
+    if skipped_members:
+        logging.debug(f"Skipped unsupported zip members: {skipped_members}")
+    return [stripped_member for _, stripped_member, _ in members]
 
 
 def clear_session_assets(session_dir: Path) -> None:
     """Clear all assets in the session directory.
     
+    The directory itself is kept and emptied in place, bottom-up.
+    
     Args:
         session_dir: Path to the session directory
     """
     if session_dir.exists():
-        shutil.rmtree(session_dir)
-        session_dir.mkdir(parents=True, exist_ok=True)
+        for dirpath, dirnames, filenames in os.walk(session_dir, topdown=False):
+            for name in filenames:
+                os.unlink(os.path.join(dirpath, name))
+            for name in dirnames:
+                path = os.path.join(dirpath, name)
+                # Symlinked directories are not descended into; drop the link
+                if os.path.islink(path):
+                    os.unlink(path)
+                else:
+                    os.rmdir(path)
         logging.info(f"Cleared session assets: {session_dir}")
 
 
@@ -193,10 +417,13 @@ def get_session_asset_files(session_dir: Path) -> list[str]:
     if not session_dir.exists():
         return []
     
+    root = str(session_dir)
+    prefix_len = len(root) + 1
     files = []
-    for item in session_dir.rglob('*'):
-        if item.is_file():
-            files.append(str(item.relative_to(session_dir)))
+    for dirpath, _dirnames, filenames in os.walk(root):
+        rel_dir = dirpath[prefix_len:]
+        for name in filenames:
+            files.append(os.path.join(rel_dir, name) if rel_dir else name)
     return sorted(files)
 
 
@@ -209,16 +436,35 @@ def _cleanup_empty_dirs(session_dir: Path) -> None:
     if not session_dir.exists():
         return
     
-    # Walk bottom-up to remove empty dirs
-    for dirpath in sorted(session_dir.rglob('*'), reverse=True):
-        if dirpath.is_dir() and not any(dirpath.iterdir()):
+    # Walk bottom-up so parents are checked after their children are removed
+    root = str(session_dir)
+    for dirpath, _dirnames, _filenames in os.walk(root, topdown=False):
+        if dirpath != root and not os.listdir(dirpath):
             try:
-                dirpath.rmdir()
+                os.rmdir(dirpath)
                 logging.debug(f"Removed empty directory: {dirpath}")
             except Exception:
                 pass
 
 
+def uploaded_asset_name(uploaded_file) -> str:
+    """Get the name an uploaded asset is saved and tracked under.
+    
+    Folder uploads (names with path separators) have their 'assets/' prefix
+    stripped, matching save_uploaded_directory.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile object
+        
+    Returns:
+        Normalized relative name of the saved file
+    """
+    name = uploaded_file.name
+    if '/' in name or '\\' in name:
+        return strip_assets_prefix(name)
+    return name
+
+
 def sync_session_files_with_uploaders(
     session_dir: Path,
     uploaded_files: list | None
@@ -236,17 +482,17 @@ def sync_session_files_with_uploaders(
     Returns:
         True if any files were deleted, False otherwise
     """
+    # Nothing can have been removed if the uploader holds the same files
+    # as on the previous rerun
+    uploader_signature = hash(tuple((f.name, f.size) for f in (uploaded_files or [])))
+    if uploader_signature == get_state_value(SessionKeys.UPLOADER_SIGNATURE):
+        return False
+    set_state_value(SessionKeys.UPLOADER_SIGNATURE, uploader_signature)
+    
     files_deleted = False
     
     # Get current file names from uploader, normalizing folder paths
-    current_files = set()
-    for f in (uploaded_files or []):
-        # Check if it's a folder upload (has path separators)
-        if '/' in f.name or '\\' in f.name:
-            normalized = strip_assets_prefix(f.name)
-        else:
-            normalized = f.name
-        current_files.add(normalized)
+    current_files = {uploaded_asset_name(f) for f in (uploaded_files or [])}
     
     # Get tracked saved files
     saved_files = get_state_value(SessionKeys.SAVED_FILES, set())
@@ -255,17 +501,20 @@ def sync_session_files_with_uploaders(
     removed_files = saved_files - current_files
     for filename in removed_files:
         file_path = session_dir / filename
-        if file_path.exists():
-            try:
-                file_path.unlink()
-                logging.info(f"Removed file (no longer in uploader): {file_path}")
-                files_deleted = True
-            except Exception as e:
-                logging.warning(f"Could not delete {file_path}: {e}")
+        # Unlink directly rather than stat first; a missing file is fine
+        try:
+            file_path.unlink()
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logging.warning(f"Could not delete {file_path}: {e}")
+            continue
+        logging.info(f"Removed file (no longer in uploader): {file_path}")
+        files_deleted = True
     
-    # Update tracking set to reflect current state
+    # Update tracking set to reflect current state (saved minus removed)
     if removed_files:
-        set_state_value(SessionKeys.SAVED_FILES, saved_files - removed_files)
+        set_state_value(SessionKeys.SAVED_FILES, saved_files & current_files)
     
     # Clean up empty subdirectories
     if files_deleted:
@@ -1,8 +1,13 @@
 """Presentation generation service."""
 
-import copy
+import atexit
+import hashlib
+import json
+import os
 import shutil
 import tempfile
+import threading
+import zipfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -15,21 +20,66 @@ from app.state import (
     set_state_value,
     get_base_config,
     get_style_overrides,
-    set_pptx_bytes,
+    set_pptx_path,
     set_output_filename,
 )
 from app.services.assets_service import get_session_asset_files
+from app.utils.hashing import sha256_digest
 
 
 @dataclass
 class GenerationResult:
     """Result of a presentation generation attempt."""
     success: bool
-    pptx_bytes: bytes | None = None
+    pptx_path: Path | None = None
     error_message: str | None = None
     exception: Exception | None = None
 
 
+def _get_session_output_dir() -> Path:
+    """Get or create the session-scoped directory for generated files.
+    
+    The directory outlives individual generations so the download section
+    can stream the latest result from disk; it is removed at process exit.
+    
+    Returns:
+        Path to the session output directory
+    """
+    output_dir = get_state_value(SessionKeys.SESSION_OUTPUT_DIR)
+    if output_dir is None:
+        output_dir = tempfile.mkdtemp(prefix='iltci_output_')
+        atexit.register(shutil.rmtree, output_dir, ignore_errors=True)
+        set_state_value(SessionKeys.SESSION_OUTPUT_DIR, output_dir)
+    
+    session_dir = Path(output_dir)
+    session_dir.mkdir(parents=True, exist_ok=True)
+    return session_dir
+
+
+def _shallow_merge(base_config: dict[str, Any]) -> dict[str, Any]:
+    """Copy the base configuration for per-generation overrides.
+    
+    Only paths and settings (incl. settings.logging) are mutated by
+    _build_merged_config, so just those branches are copied instead of
+    deep-copying the whole tree. Missing sections start out empty.
+    
+    Args:
+        base_config: Shared, read-only base configuration
+        
+    Returns:
+        Configuration whose paths/settings/logging dicts are safe to mutate
+    """
+    base_settings = base_config.get('settings', {})
+    return {
+        **base_config,
+        'paths': {**base_config.get('paths', {})},
+        'settings': {
+            **base_settings,
+            'logging': {**base_settings.get('logging', {})},
+        },
+    }
+
+
 def _build_merged_config(
     content_source: str,
     template_source: str,
@@ -57,7 +107,7 @@ def _build_merged_config(
     Returns:
         Tuple of (merged_config, output_path)
     """
-    merged_config = copy.deepcopy(get_base_config())
+    merged_config = _shallow_merge(get_base_config())
     
     # Handle content path
     if content_source == "Upload custom content" and uploaded_content_path:
@@ -93,8 +143,8 @@ def _build_merged_config(
     
     # Handle output path
     if use_temp_output:
-        temp_dir = Path(tempfile.mkdtemp(prefix='iltci_pptx_'))
-        output_path = temp_dir / output_filename
+        # Reuse one directory per session; each generation overwrites its file
+        output_path = _get_session_output_dir() / output_filename
     else:
         output_path = PROJECT_ROOT / "output" / output_filename
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -109,6 +159,159 @@ def _build_merged_config(
     return merged_config, output_path
 
 
+def _file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, or '' if it is not a file."""
+    if not path.is_file():
+        return ''
+    with open(path, 'rb') as f:
+        return sha256_digest(f)
+
+
+def _dir_signature(directory: Path) -> list[tuple[str, int, int]]:
+    """Return (relative path, size, mtime_ns) for every file under a directory."""
+    signature = []
+    for root, _dirs, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            signature.append((os.path.relpath(path, directory), stat.st_size, stat.st_mtime_ns))
+    signature.sort()
+    return signature
+
+
+def _frontmatter_template_path(cfg: Any, content_path: Path | None) -> Path | None:
+    """Resolve the template named by the content's document frontmatter.
+    
+    Args:
+        cfg: Config instance (provides project_root)
+        content_path: Markdown content file (if any)
+        
+    Returns:
+        Path from the frontmatter 'template' key, or None if there is none
+    """
+    if content_path is None or not content_path.is_file():
+        return None
+    from iltci_pptx.markdown_parser import parse_document_frontmatter
+    
+    frontmatter, _ = parse_document_frontmatter(content_path.read_text(encoding='utf-8'))
+    template = frontmatter.get('template')
+    if not template or not isinstance(template, str):
+        return None
+    return cfg.project_root / template
+
+
+def _generation_cache_key(
+    cfg: Any,
+    merged_config: dict[str, Any],
+    template_source: str,
+    template_override: Path | None,
+    style_overrides: dict[str, Any] | None,
+) -> str:
+    """Build a content-addressed key for everything that affects the output.
+    
+    Input files are keyed by content digest (not by path), so uploads that
+    land in fresh temp files still hit the cache when their bytes match.
+    
+    Args:
+        cfg: Config instance built from merged_config
+        merged_config: Merged configuration dictionary
+        template_source: "None", "Default", or "Upload custom template"
+        template_override: Uploaded template path (if any)
+        style_overrides: Style overrides dictionary (if any)
+        
+    Returns:
+        Hex digest identifying the generation inputs
+    """
+    def resolved(key: str) -> Path | None:
+        try:
+            return cfg.get_path(key)
+        except ValueError:
+            return None
+    
+    if template_source == "None":
+        template_digest = 'blank'
+    else:
+        template_path = template_override or resolved('template')
+        template_digest = _file_digest(template_path) if template_path else ''
+    
+    # Without an override the generator may switch to a template named in
+    # the content's frontmatter, so that file is an input too
+    frontmatter_template = None
+    if template_source != "None" and template_override is None:
+        frontmatter_template = _frontmatter_template_path(cfg, resolved('content'))
+    frontmatter_template_digest = _file_digest(frontmatter_template) if frontmatter_template else ''
+    
+    file_digests = {}
+    for key in ('content', 'styles_overrides', 'template_config'):
+        path = resolved(key)
+        file_digests[key] = _file_digest(path) if path else ''
+    assets_dir = resolved('assets_dir')
+    assets_signature = _dir_signature(assets_dir) if assets_dir and assets_dir.is_dir() else []
+    
+    settings = {key: value for key, value in merged_config.items() if key != 'paths'}
+    payload = json.dumps(
+        [
+            settings,
+            style_overrides,
+            template_digest,
+            frontmatter_template_digest,
+            file_digests,
+            assets_signature,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# Set by _render_pptx_bytes on the calling thread when the generator ran
+# (a cache miss) and has already saved the deck to the output path
+_render_state = threading.local()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _render_pptx_bytes(
+    cache_key: str,
+    _cfg: Any,
+    _template_override: Path | None,
+    _use_blank_template: bool,
+    _style_overrides: dict[str, Any] | None,
+) -> bytes:
+    """Run the generator and return the PPTX bytes.
+    
+    Streamlit keys the cache on cache_key only (underscore-prefixed
+    arguments are not hashed), so identical inputs skip generation.
+    
+    Args:
+        cache_key: Key from _generation_cache_key()
+        _cfg: Config instance to generate from
+        _template_override: Uploaded template path (if any)
+        _use_blank_template: Generate against a blank built-in template
+        _style_overrides: Style overrides dictionary (if any)
+        
+    Returns:
+        Generated PPTX file content
+    """
+    from iltci_pptx.generator import PresentationGenerator
+    
+    generator = PresentationGenerator(_cfg)
+    
+    template_override = _template_override
+    if _use_blank_template:
+        # Point the generator at python-pptx's bundled default package (the
+        # file Presentation() itself opens) instead of re-saving a copy
+        import pptx
+        template_override = Path(pptx.__file__).parent / 'templates' / 'default.pptx'
+    
+    generator.generate(
+        template_override=template_override,
+        style_overrides=_style_overrides,
+    )
+    _render_state.generated = True
+    
+    return _cfg.output_path.read_bytes()
+
+
 def generate_presentation(
     content_source: str,
     template_source: str,
@@ -136,11 +339,21 @@ def generate_presentation(
     Returns:
         GenerationResult with success status and data
     """
+    # An upload mode without an uploaded file would otherwise silently fall
+    # back to the default content/template and run a full, wasted build.
+    if content_source == "Upload custom content" and not uploaded_content_path:
+        return GenerationResult(
+            success=False,
+            error_message="No uploaded content file was provided.",
+        )
+    if template_source == "Upload custom template" and not uploaded_template_path:
+        return GenerationResult(
+            success=False,
+            error_message="No uploaded template file was provided.",
+        )
+    
     # Import here to avoid import issues before path setup
     from iltci_pptx.config import Config
-    from iltci_pptx.generator import PresentationGenerator
-    
-    temp_dir: Path | None = None
     
     try:
         merged_config, output_path = _build_merged_config(
@@ -155,10 +368,6 @@ def generate_presentation(
             uploaded_template_path=uploaded_template_path,
         )
         
-        # Track temp_dir for cleanup
-        if use_temp_output:
-            temp_dir = output_path.parent
-        
         # Determine if template should be excluded from path validation
         exclude_paths: list[str] = []
         if template_source in ("None", "Upload custom template"):
@@ -170,41 +379,47 @@ def generate_presentation(
             CONFIG_DIR,
             exclude=exclude_paths or None,
         )
-        generator = PresentationGenerator(cfg)
         
         # Determine template override
-        temp_blank_template: str | None = None
-        if template_source == "None":
-            # Create a blank presentation to use as template (built-in layouts only)
-            from pptx import Presentation
-            blank_prs = Presentation()
-            temp_blank_template = write_temp_file(b'', '.pptx')
-            blank_prs.save(temp_blank_template)
-            template_override = Path(temp_blank_template)
-        elif template_source == "Upload custom template" and uploaded_template_path:
+        if template_source == "Upload custom template" and uploaded_template_path:
             template_override = Path(uploaded_template_path)
         else:
             template_override = None
         
-        try:
-            generator.generate(
-                template_override=template_override,
-                style_overrides=get_style_overrides(),
-            )
-        finally:
-            # Clean up blank template temp file
-            cleanup_temp_file(temp_blank_template)
+        style_overrides = get_style_overrides()
+        cache_key = _generation_cache_key(
+            cfg, merged_config, template_source, template_override, style_overrides
+        )
+        _render_state.generated = False
+        pptx_bytes = _render_pptx_bytes(
+            cache_key,
+            cfg,
+            template_override,
+            template_source == "None",
+            style_overrides,
+        )
         
-        # Read generated file
-        pptx_bytes = output_path.read_bytes()
+        # A cache hit skips the generator, so write the result where the
+        # download section reads it; on a miss the generator already did.
+        if not _render_state.generated:
+            output_path.write_bytes(pptx_bytes)
+        
+        # The download section reads PPTX_PATH lazily, so point it at a
+        # session-private file; the shared output/ copy can be replaced by
+        # another session generating the same filename.
+        if use_temp_output:
+            download_path = output_path
+        else:
+            download_path = _get_session_output_dir() / output_filename
+            download_path.write_bytes(pptx_bytes)
         
         # Update session state
-        set_pptx_bytes(pptx_bytes)
+        set_pptx_path(str(download_path))
         set_output_filename(output_filename)
         
         return GenerationResult(
             success=True,
-            pptx_bytes=pptx_bytes,
+            pptx_path=download_path,
         )
         
     except FileNotFoundError as e:
@@ -219,43 +434,82 @@ def generate_presentation(
             error_message=f"Generation failed: {e}",
             exception=e,
         )
-    finally:
-        # Cleanup temp directory
-        if temp_dir and temp_dir.exists():
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception:
-                pass
 
 
-def write_temp_file(content: bytes, suffix: str) -> str:
-    """Write content to a temporary file.
+_POTX_MAIN_CONTENT_TYPE = b'application/vnd.openxmlformats-officedocument.presentationml.template.main+xml'
+_PPTX_MAIN_CONTENT_TYPE = b'application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml'
+
+
+def _write_potx_as_pptx(uploaded_file: Any, dest_path: Path) -> None:
+    """Copy a .potx upload to dest_path with a presentation content type.
+    
+    Only [Content_Types].xml is rewritten; every other part is copied
+    unchanged. The package is written to a sibling '.part' file and moved
+    into place, so a failed conversion leaves no partial file behind.
     
     Args:
-        content: File content as bytes
-        suffix: File suffix (e.g., '.md', '.pptx')
+        uploaded_file: File-like object positioned at the start of the .potx
+        dest_path: Path of the .pptx package to write
         
-    Returns:
-        Path to the temporary file
+    Raises:
+        ValueError: If the upload is not a readable zip package
     """
-    temp_file = tempfile.NamedTemporaryFile(
-        mode='wb',
-        suffix=suffix,
-        delete=False
-    )
-    temp_file.write(content)
-    temp_file.close()
-    return temp_file.name
+    part_path = dest_path.with_name(dest_path.name + '.part')
+    try:
+        with zipfile.ZipFile(uploaded_file) as src, zipfile.ZipFile(part_path, 'w') as dst:
+            for info in src.infolist():
+                data = src.read(info)
+                if info.filename == '[Content_Types].xml':
+                    data = data.replace(_POTX_MAIN_CONTENT_TYPE, _PPTX_MAIN_CONTENT_TYPE)
+                dst.writestr(info, data)
+        os.replace(part_path, dest_path)
+    except (zipfile.BadZipFile, KeyError) as e:
+        part_path.unlink(missing_ok=True)
+        raise ValueError(f"Invalid .potx template: {e}") from e
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
 
 
-def cleanup_temp_file(path: str | None) -> None:
-    """Clean up a temporary file.
+def materialize_upload(uploaded_file: Any, suffix: str, slot: str) -> str:
+    """Write an uploaded file to the session output directory, once per upload.
+    
+    The path is remembered per slot together with the upload's file_id, so
+    reruns and repeated generations with the same upload reuse the file on
+    disk. A new upload in the same slot overwrites it. The file is removed
+    with the session output directory.
     
     Args:
-        path: Path to the temporary file (or None)
+        uploaded_file: Streamlit UploadedFile
+        suffix: File suffix (e.g., '.md', '.pptx'); '.potx' uploads are
+            stored as '.pptx'
+        slot: Name of the upload slot (e.g., 'content', 'template')
+        
+    Returns:
+        Path to the materialized file
+        
+    Raises:
+        ValueError: If a '.potx' upload is not a valid package
     """
-    if path and Path(path).exists():
-        try:
-            Path(path).unlink()
-        except Exception:
-            pass
+    materialized = get_state_value(SessionKeys.MATERIALIZED_UPLOADS, {})
+    file_id = getattr(uploaded_file, 'file_id', None)
+    cached = materialized.get(slot)
+    if file_id is not None and cached is not None and cached[0] == file_id and Path(cached[1]).is_file():
+        return cached[1]
+    
+    upload_dir = _get_session_output_dir() / 'uploads'
+    upload_dir.mkdir(exist_ok=True)
+    uploaded_file.seek(0)
+    if suffix.lower() == '.potx':
+        # python-pptx only opens presentation packages, so retag the
+        # template once here rather than on every load
+        path = upload_dir / f"{slot}.pptx"
+        _write_potx_as_pptx(uploaded_file, path)
+    else:
+        path = upload_dir / f"{slot}{suffix}"
+        with open(path, 'wb') as out:
+            shutil.copyfileobj(uploaded_file, out, length=1024 * 1024)
+    
+    materialized[slot] = (file_id, str(path))
+    set_state_value(SessionKeys.MATERIALIZED_UPLOADS, materialized)
+    return str(path)
@@ -6,7 +6,14 @@ from pathlib import Path
 
 import streamlit as st
 
-from app.constants import SessionKeys
+from app.config_loader import load_base_config
+from app.constants import (
+    SessionKeys,
+    DEFAULT_PAGE_TITLE,
+    DEFAULT_PAGE_LAYOUT,
+    DEFAULT_OUTPUT_FILENAME,
+    DEFAULT_LOG_LEVEL,
+)
 
 
 @dataclass
@@ -38,13 +45,62 @@ class GenerationRequest:
 class AppState:
     """Application state container."""
     base_config: dict[str, Any] = field(default_factory=dict)
-    pptx_bytes: bytes | None = None
+    pptx_path: str | None = None
     output_filename: str | None = None
     template_path: str | None = None
     custom_assets_dir: str | None = None
     style_overrides: dict[str, Any] | None = None
     saved_files: set[str] = field(default_factory=set)
-    saved_zip_files: set[str] = field(default_factory=set)
+    last_zip_upload_id: str | None = None
+
+
+@dataclass(frozen=True)
+class UIDefaults:
+    """UI defaults resolved once from the base configuration."""
+    page_title: str = DEFAULT_PAGE_TITLE
+    page_layout: str = DEFAULT_PAGE_LAYOUT
+    output_filename: str = DEFAULT_OUTPUT_FILENAME
+    use_temp_output: bool = True
+    overwrite_output: bool = True
+    log_level: str = DEFAULT_LOG_LEVEL
+    show_template_paths: bool = False
+    style_overrides_mode: str = "Default"
+    content_path: str = 'content/slides.md'
+    template_path: str = 'templates/template.pptx'
+    template_config_path: str = 'assets/template-config.yaml'
+    notes_path: str = ''
+    assets_dir: str = 'assets/'
+    
+    @classmethod
+    def from_config(cls, base_config: dict[str, Any]) -> "UIDefaults":
+        """Build UI defaults from a base configuration dictionary.
+        
+        Args:
+            base_config: Base configuration dictionary
+            
+        Returns:
+            UIDefaults with missing keys falling back to class defaults
+        """
+        ui_config = base_config.get('ui', {})
+        page = ui_config.get('page', {})
+        defaults = ui_config.get('defaults', {})
+        settings = base_config.get('settings', {})
+        paths = base_config.get('paths', {})
+        return cls(
+            page_title=page.get('title', DEFAULT_PAGE_TITLE),
+            page_layout=page.get('layout', DEFAULT_PAGE_LAYOUT),
+            output_filename=defaults.get('output_filename', DEFAULT_OUTPUT_FILENAME),
+            use_temp_output=defaults.get('use_temp_output', True),
+            overwrite_output=settings.get('overwrite_output', True),
+            log_level=settings.get('logging', {}).get('level', DEFAULT_LOG_LEVEL),
+            show_template_paths=ui_config.get('advanced', {}).get('show_template_paths', False),
+            style_overrides_mode=ui_config.get('style_overrides_mode', "Default"),
+            content_path=paths.get('content', 'content/slides.md'),
+            template_path=paths.get('template', 'templates/template.pptx'),
+            template_config_path=paths.get('template_config', 'assets/template-config.yaml'),
+            notes_path=paths.get('notes', ''),
+            assets_dir=paths.get('assets_dir', 'assets/'),
+        )
 
 
 # === Session State Wrapper Functions ===
@@ -95,33 +151,24 @@ def delete_state_key(key: str) -> None:
 
 
 def get_base_config() -> dict[str, Any]:
-    """Get the base configuration from session state."""
-    return get_state_value(SessionKeys.BASE_CONFIG, {})
-
-
-def get_ui_config() -> dict[str, Any]:
-    """Get the UI configuration section."""
-    return get_base_config().get('ui', {})
-
-
-def get_paths_config() -> dict[str, Any]:
-    """Get the paths configuration section."""
-    return get_base_config().get('paths', {})
+    """Get the base configuration from the cached config loader."""
+    return load_base_config()
 
 
-def get_settings_config() -> dict[str, Any]:
-    """Get the settings configuration section."""
-    return get_base_config().get('settings', {})
+@st.cache_resource(show_spinner=False)
+def get_ui_defaults() -> UIDefaults:
+    """Get the UI defaults, resolved once per process from the base config."""
+    return UIDefaults.from_config(load_base_config())
 
 
-def get_pptx_bytes() -> bytes | None:
-    """Get the generated PPTX bytes from session state."""
-    return get_state_value(SessionKeys.PPTX_BYTES)
+def get_pptx_path() -> str | None:
+    """Get the path of the generated PPTX file from session state."""
+    return get_state_value(SessionKeys.PPTX_PATH)
 
 
-def set_pptx_bytes(data: bytes | None) -> None:
-    """Set the generated PPTX bytes in session state."""
-    set_state_value(SessionKeys.PPTX_BYTES, data)
+def set_pptx_path(path: str | None) -> None:
+    """Set the path of the generated PPTX file in session state."""
+    set_state_value(SessionKeys.PPTX_PATH, path)
 
 
 def get_output_filename() -> str | None:
@@ -164,14 +211,14 @@ def set_saved_files(files: set[str]) -> None:
     set_state_value(SessionKeys.SAVED_FILES, files)
 
 
-def get_saved_zip_files() -> set[str]:
-    """Get the set of saved zip files from session state."""
-    return get_state_value(SessionKeys.SAVED_ZIP_FILES, set())
+def get_last_zip_upload_id() -> str | None:
+    """Get the file_id of the last processed zip upload from session state."""
+    return get_state_value(SessionKeys.LAST_ZIP_UPLOAD_ID)
 
 
-def set_saved_zip_files(files: set[str]) -> None:
-    """Set the saved zip files set in session state."""
-    set_state_value(SessionKeys.SAVED_ZIP_FILES, files)
+def set_last_zip_upload_id(file_id: str | None) -> None:
+    """Set the file_id of the last processed zip upload in session state."""
+    set_state_value(SessionKeys.LAST_ZIP_UPLOAD_ID, file_id)
 
 
 def get_log_level() -> str:
@@ -1,5 +1,6 @@
 """Utility modules for the Streamlit app."""
 
-from app.utils.fs_safety import is_safe_filename, strip_assets_prefix
+from app.utils.fs_safety import file_suffix, is_safe_filename, strip_assets_prefix
+from app.utils.hashing import sha256_digest
 
-__all__ = ['is_safe_filename', 'strip_assets_prefix']
+__all__ = ['file_suffix', 'is_safe_filename', 'strip_assets_prefix', 'sha256_digest']
@@ -1,6 +1,11 @@
 """File system safety utilities - pure functions for path validation."""
 
 import logging
+import re
+
+# Path traversal ('..' anywhere), absolute paths, and Windows drive
+# prefixes such as 'C:...', matched in a single scan
+_UNSAFE_FILENAME_RE = re.compile(r'\.\.|^/|^.:.', re.DOTALL)
 
 
 def is_safe_filename(filename: str) -> bool:
@@ -14,15 +19,27 @@ def is_safe_filename(filename: str) -> bool:
     Returns:
         True if safe, False otherwise
     """
-    # Reject path traversal
-    if '..' in filename or filename.startswith('/'):
-        return False
+    return _UNSAFE_FILENAME_RE.search(filename) is None
+
+
+def file_suffix(filename: str) -> str:
+    """Return the lowercased extension of a filename, including the dot.
     
-    # Reject Windows drive prefixes
-    if ':' in filename and len(filename) > 2 and filename[1] == ':':
-        return False
+    Pure function equivalent to ``Path(filename).suffix.lower()`` for
+    '/'-separated names, without building a Path object.
     
-    return True
+    Args:
+        filename: File name or '/'-separated relative path
+        
+    Returns:
+        Lowercased suffix (e.g. '.png'), or '' if there is none
+    """
+    dot = filename.rfind('.')
+    # No suffix when the dot is missing, belongs to a directory name,
+    # starts a dotfile name, or ends the name
+    if dot <= filename.rfind('/') + 1 or dot == len(filename) - 1:
+        return ''
+    return filename[dot:].lower()
 
 
 def strip_assets_prefix(rel_path: str) -> str:
@@ -39,8 +56,12 @@ def strip_assets_prefix(rel_path: str) -> str:
     Returns:
         Path with 'assets/' prefix stripped
     """
-    # Normalize slashes
-    normalized = rel_path.replace('\\', '/')
+    # Normalize slashes (only allocate a new string when there are any)
+    normalized = rel_path.replace('\\', '/') if '\\' in rel_path else rel_path
+    
+    # Common case: nothing to strip
+    if not normalized.startswith(('./', 'assets/')):
+        return normalized
     
     # Strip leading './' if present
     if normalized.startswith('./'):
@@ -49,6 +70,7 @@ def strip_assets_prefix(rel_path: str) -> str:
     # Strip 'assets/' prefix if present
     if normalized.startswith('assets/'):
         normalized = normalized[7:]  # len('assets/') = 7
-        logging.debug(f"Stripped 'assets/' prefix: {rel_path!r} -> {normalized!r}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"Stripped 'assets/' prefix: {rel_path!r} -> {normalized!r}")
     
     return normalized
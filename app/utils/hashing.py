@@ -0,0 +1,26 @@
+"""Content hashing utilities."""
+
+import hashlib
+from typing import BinaryIO
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def sha256_digest(fileobj: BinaryIO) -> str:
+    """Return the SHA-256 hex digest of a binary file object.
+    
+    The object is read in chunks from the start and rewound afterwards, so
+    it can be consumed again by the caller.
+    
+    Args:
+        fileobj: Seekable binary file object (open file or UploadedFile)
+        
+    Returns:
+        Hex digest of the object's content
+    """
+    digest = hashlib.sha256()
+    fileobj.seek(0)
+    for chunk in iter(lambda: fileobj.read(_HASH_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest()
@@ -5,6 +5,11 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Iterable
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 def load_yaml_file(file_path: Path) -> Dict[str, Any]:
     """Load a YAML file and return its contents."""
@@ -12,7 +17,7 @@ def load_yaml_file(file_path: Path) -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {file_path}")
     
     with open(file_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
         return data if data is not None else {}
 
 
@@ -14,6 +14,7 @@ from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE
 from pptx.enum.shapes import PP_PLACEHOLDER_TYPE as PH_TYPE
 from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from pptx.enum.text import PP_ALIGN
+from pptx.oxml.ns import qn
 from .config import Config
 from .markdown_parser import SlideData
 
@@ -22,6 +23,14 @@ if TYPE_CHECKING:
     from pptx.shapes.picture import Picture
     from .layout_discovery import LayoutRegistry
 
+# Clark-notation tag names used when editing picture/shape XML, resolved once
+_QN_PRST_GEOM = qn('a:prstGeom')
+_QN_AV_LST = qn('a:avLst')
+_QN_GD = qn('a:gd')
+_QN_SOLID_FILL = qn('a:solidFill')
+_QN_SRGB_CLR = qn('a:srgbClr')
+_QN_ALPHA = qn('a:alpha')
+
 # Default image style settings for borders and rounded corners
 IMAGE_STYLE_DEFAULTS = {
     'border_width': Pt(2),           # 2pt border width
@@ -138,8 +147,8 @@ def apply_image_style(picture: 'Picture', style: Dict[str, Any]) -> None:
         # Apply border styling
         if style.get('border_enabled', True):
             line = picture.line
-            line.width = style.get('border_width', Pt(2))
-            line.color.rgb = style.get('border_color', RGBColor(68, 84, 106))
+            line.width = style.get('border_width', IMAGE_STYLE_DEFAULTS['border_width'])
+            line.color.rgb = style.get('border_color', IMAGE_STYLE_DEFAULTS['border_color'])
         else:
             # Remove border
             picture.line.fill.background()
@@ -148,7 +157,7 @@ def apply_image_style(picture: 'Picture', style: Dict[str, Any]) -> None:
         # PowerPoint uses shape adjustments (adj) for rounded rectangles
         # For pictures, we need to use XML manipulation for soft edges/rounded corners
         if style.get('rounded_enabled', True):
-            corner_radius = style.get('corner_radius', Inches(0.1))
+            corner_radius = style.get('corner_radius', IMAGE_STYLE_DEFAULTS['corner_radius'])
             _apply_rounded_corners(picture, corner_radius)
         
         logging.debug(f"Applied image style: border={style.get('border_enabled')}, rounded={style.get('rounded_enabled')}")
@@ -165,25 +174,24 @@ def _apply_rounded_corners(picture: 'Picture', radius: int) -> None:
         radius: Corner radius in EMUs
     """
     try:
-        from pptx.oxml.ns import qn
         from lxml import etree
         
         # Get the spPr (shape properties) element
         spPr = picture._pic.spPr
         
         # Check if prstGeom exists, if not create it
-        prstGeom = spPr.find(qn('a:prstGeom'))
+        prstGeom = spPr.find(_QN_PRST_GEOM)
         if prstGeom is None:
             # Create preset geometry for rounded rectangle
-            prstGeom = etree.SubElement(spPr, qn('a:prstGeom'))
+            prstGeom = etree.SubElement(spPr, _QN_PRST_GEOM)
         
         # Set to rounded rectangle preset
         prstGeom.set('prst', 'roundRect')
         
         # Add or update adjustment values for corner radius
-        avLst = prstGeom.find(qn('a:avLst'))
+        avLst = prstGeom.find(_QN_AV_LST)
         if avLst is None:
-            avLst = etree.SubElement(prstGeom, qn('a:avLst'))
+            avLst = etree.SubElement(prstGeom, _QN_AV_LST)
         
         # Clear existing adjustments
         for child in list(avLst):
@@ -197,9 +205,7 @@ def _apply_rounded_corners(picture: 'Picture', radius: int) -> None:
             # Rough conversion - smaller radius = smaller adj value
             adj_val = min(int(radius / 914400 * 100000), 50000)  # Cap at 50%
         
-        gd = etree.SubElement(avLst, qn('a:gd'))
-        gd.set('name', 'adj')
-        gd.set('fmla', f'val {adj_val}')
+        etree.SubElement(avLst, _QN_GD, attrib={'name': 'adj', 'fmla': f'val {adj_val}'})
         
         logging.debug(f"Applied rounded corners with adj={adj_val}")
         
@@ -277,16 +283,15 @@ def add_overlay_rectangle(slide: 'Slide', left: float, top: float,
         
         # Note: python-pptx doesn't directly support fill transparency easily
         # We need to use XML manipulation for proper transparency
-        from pptx.oxml.ns import qn
         spPr = shape._sp.spPr
-        solidFill = spPr.find(qn('a:solidFill'))
+        solidFill = spPr.find(_QN_SOLID_FILL)
         if solidFill is not None:
-            srgbClr = solidFill.find(qn('a:srgbClr'))
+            srgbClr = solidFill.find(_QN_SRGB_CLR)
             if srgbClr is not None:
                 # Add alpha element for transparency
                 # alpha value is 0-100000 where 100000 = fully opaque
                 alpha_val = int((1 - transparency) * 100000)
-                alpha = srgbClr.makeelement(qn('a:alpha'), {})
+                alpha = srgbClr.makeelement(_QN_ALPHA, {})
                 alpha.set('val', str(alpha_val))
                 srgbClr.append(alpha)
         
@@ -22,7 +22,7 @@ from typing import Any
 
 import yaml
 
-from .config import Config
+from .config import Config, _YamlLoader
 from .layout_discovery import LayoutRegistry, validate_layout_name, get_available_layout_names
 
 logger = logging.getLogger(__name__)
@@ -92,7 +92,7 @@ def parse_document_frontmatter(content: str, delimiter: str = '---') -> tuple[di
     frontmatter_text = '\n'.join(frontmatter_lines)
     
     try:
-        frontmatter = yaml.safe_load(frontmatter_text) or {}
+        frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader) or {}
     except yaml.YAMLError as e:
         logger.warning(f"Failed to parse document YAML frontmatter: {e}")
         frontmatter = {}
@@ -146,7 +146,7 @@ def parse_slide_frontmatter(slide_content: str) -> tuple[dict[str, Any], str]:
     yaml_text = '\n'.join(yaml_lines)
     
     try:
-        frontmatter = yaml.safe_load(yaml_text) or {}
+        frontmatter = yaml.load(yaml_text, Loader=_YamlLoader) or {}
     except yaml.YAMLError as e:
         logger.warning(f"Failed to parse slide YAML frontmatter: {e}")
         frontmatter = {}